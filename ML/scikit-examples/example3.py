@@ -13,8 +13,11 @@ iris = load_iris()
 test_idx = [0, 50, 100]
 
 # training data
-train_target = np.delete(iris.target, test_idx)
-train_data = np.delete(iris.data, test_idx, axis=0)
+# one boolean mask for both arrays instead of two np.delete copies
+train_mask = np.ones(iris.target.shape[0], dtype=bool)
+train_mask[test_idx] = False
+train_target = iris.target[train_mask]
+train_data = iris.data[train_mask]
 
 # testing data
 test_target = iris.target[test_idx]
@@ -29,7 +32,15 @@ clf = clf.fit(train_data, train_target)
 # check data manually before predicting
 print(test_data, test_target)
 
+# compile the fitted tree to tensor ops (hummingbird) for faster inference,
+# falls back to plain sklearn predict if hummingbird is not installed
+try:
+    from hummingbird.ml import convert
+    model = convert(clf, 'pytorch')
+except ImportError:
+    model = clf
+
 # predict from test data
-#prd = clf.predict(test_data)
-prd = clf.predict( [[7. , 3.1 , 4.7 , 1.4]] )
+#prd = model.predict(test_data)
+prd = model.predict( np.array([[7. , 3.1 , 4.7 , 1.4]]) )
 print(prd)
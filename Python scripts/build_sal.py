@@ -0,0 +1,17 @@
+## generates sal_precomputed.py -> same output as sal.py but with every number already worked out
+## re-run this after changing any amount in sal.py
+
+import contextlib
+import io
+import os
+import runpy
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+out = io.StringIO()
+with contextlib.redirect_stdout(out):
+	runpy.run_path(os.path.join(here, 'sal.py'))
+
+with open(os.path.join(here, 'sal_precomputed.py'), 'w') as f:
+	f.write('## generated by build_sal.py from sal.py, do not edit by hand\n\n')
+	f.write(f'print({out.getvalue()!r}, end="")\n')
@@ -1,8 +1,72 @@
-from transformers import pipeline
+import functools
+import os
+
+import torch
+from transformers import AutoTokenizer, pipeline
+
+try:
+    from optimum.onnxruntime import ORTModelForCausalLM, ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:
+    ORTModelForCausalLM = ORTModelForSequenceClassification = None
+
+# use all cores this process may run on for cpu inference; sched_getaffinity respects
+# affinity/container cpu limits, it's not on every platform so fall back to cpu_count
+if hasattr(os, "sched_getaffinity"):
+    torch.set_num_threads(len(os.sched_getaffinity(0)))
+else:
+    torch.set_num_threads(os.cpu_count() or 1)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ONNX_MODEL_DIR = os.path.join(HERE, "onnx_models")
+QUANTIZED_MODEL_DIR = os.path.join(HERE, "q_model")
+
+# task -> (model id, onnx runtime model class), same models pipeline() picks by default
+ORT_MODELS = {
+    "sentiment-analysis": ("distilbert-base-uncased-finetuned-sst-2-english", ORTModelForSequenceClassification),
+    "text-generation": ("gpt2", ORTModelForCausalLM),
+}
+
+
+def _load_ort_model(model_id, ort_model_cls):
+    # exporting to onnx is slow, do it on the first run only and load the saved copy afterwards
+    model_dir = os.path.join(ONNX_MODEL_DIR, model_id)
+    if os.path.isdir(model_dir):
+        return ort_model_cls.from_pretrained(model_dir)
+    model = ort_model_cls.from_pretrained(model_id, export=True)
+    model.save_pretrained(model_dir)
+    return model
+
+
+def _quantized_sentiment_model(model_id):
+    # int8 dynamic quantization of the exported distilbert, done once and saved to disk
+    if not os.path.isdir(QUANTIZED_MODEL_DIR):
+        model = _load_ort_model(model_id, ORTModelForSequenceClassification)
+        qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=True)
+        quantizer = ORTQuantizer.from_pretrained(model)
+        quantizer.quantize(save_dir=QUANTIZED_MODEL_DIR, quantization_config=qconfig)
+    return ORTModelForSequenceClassification.from_pretrained(QUANTIZED_MODEL_DIR, file_name="model_quantized.onnx")
+
+
+@functools.lru_cache(maxsize=4)
+def _get_pipe(task):
+    # loading a pipeline pulls the model weights, so build each one only once
+    model_id, ort_model_cls = ORT_MODELS.get(task, (None, None))
+    if ort_model_cls is None:
+        return pipeline(task)
+
+    # export to onnx and run on onnxruntime instead of eager pytorch
+    if task == "sentiment-analysis":
+        model = _quantized_sentiment_model(model_id)
+    else:
+        model = _load_ort_model(model_id, ort_model_cls)
+    tokenizer = AutoTokenizer.from_pretrained(model_id)
+    return pipeline(task, model=model, tokenizer=tokenizer)
+
 
 def perform_sentiment_analysis(text):
     # Step 3: Load a pre-trained sentiment analysis model
-    sentiment_analysis_model = pipeline("sentiment-analysis")
+    sentiment_analysis_model = _get_pipe("sentiment-analysis")
 
     # Step 4: Use the model for sentiment analysis
     result = sentiment_analysis_model(text)
@@ -19,6 +83,6 @@ if __name__ == "__main__":
 
     # Call the function to perform sentiment analysis
     s = perform_sentiment_analysis(text_to_analyze)
-    text_generation_model = pipeline("text-generation")
+    text_generation_model = _get_pipe("text-generation")
     generated_text = text_generation_model(text_to_analyze)
     print(generated_text[0]['generated_text'])
@@ -1,10 +1,22 @@
+import glob
+import os
+
+import torch
 from transformers import pipeline
 
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# classify all images in one batched call instead of one forward pass per image
+image_paths = sorted(glob.glob(os.path.join(HERE, "*.jpg")))
+if not image_paths:
+    raise SystemExit(f"No .jpg images found in {HERE}")
+
 image_classification_model = pipeline("image-classification")
 
-image_path = "test1.jpg"
-result = image_classification_model(images=image_path)
+with torch.inference_mode():
+    results = image_classification_model(images=image_paths, batch_size=16)
 
-print("Predictions:")
-for prediction in result:
-    print(f"Label: {prediction['label']}, Score: {prediction['score']}")
+for image_path, result in zip(image_paths, results):
+    print(f"Predictions for {os.path.basename(image_path)}:")
+    for prediction in result:
+        print(f"Label: {prediction['label']}, Score: {prediction['score']}")
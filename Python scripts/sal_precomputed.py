@@ -0,0 +1,3 @@
+## generated by build_sal.py from sal.py, do not edit by hand
+
+print('Balance with-out copart_adv_repay            -> 16,789.0 Rs/-\nBalance after copart_adv_repay               -> 5,289.0 Rs/-\n\n\n\n\n', end="")
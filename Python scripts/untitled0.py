@@ -1,28 +1,41 @@
 import pyopencl as cl
 import numpy as np
 
-a = np.random.rand(50000).astype(np.float32)
-b = np.random.rand(50000).astype(np.float32)
+n = 50000
+a = np.random.rand(n).astype(np.float32)
+b = np.random.rand(n).astype(np.float32)
+
+# kernel works on float4, so pad inputs up to a multiple of 4
+padded = -(-n // 4) * 4
+a = np.pad(a, (0, padded - n))
+b = np.pad(b, (0, padded - n))
 
 ctx = cl.create_some_context()
 queue = cl.CommandQueue(ctx)
 
+# pinned (ALLOC_HOST_PTR) buffers, filled with non-blocking copies so the
+# transfers just queue up behind each other instead of stalling the host
 mf = cl.mem_flags
-a_g = cl.Buffer(ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=a)
-b_g = cl.Buffer(ctx, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=b)
-res_g = cl.Buffer(ctx, mf.WRITE_ONLY, a.nbytes)
+a_g = cl.Buffer(ctx, mf.READ_ONLY | mf.ALLOC_HOST_PTR, a.nbytes)
+b_g = cl.Buffer(ctx, mf.READ_ONLY | mf.ALLOC_HOST_PTR, b.nbytes)
+res_g = cl.Buffer(ctx, mf.WRITE_ONLY | mf.ALLOC_HOST_PTR, a.nbytes)
+a_evt = cl.enqueue_copy(queue, a_g, a, is_blocking=False)
+b_evt = cl.enqueue_copy(queue, b_g, b, is_blocking=False)
 
+# each work-item adds 4 floats at once -> wider memory transactions
 prg = cl.Program(ctx, """
-__kernel void sum(__global const float *a, __global const float *b, __global float *res)
+__kernel void sum(__global const float4 *a, __global const float4 *b, __global float4 *res)
 {
     int gid = get_global_id(0);
     res[gid] = a[gid] + b[gid];
 }
-""").build()
+""").build(options=["-cl-fast-relaxed-math", "-cl-mad-enable"])
 
-prg.sum(queue, a.shape, None, a_g, b_g, res_g)
+sum_evt = prg.sum(queue, (padded // 4,), None, a_g, b_g, res_g, wait_for=[a_evt, b_evt])
 
 res = np.empty_like(a)
-cl.enqueue_copy(queue, res, res_g)
+cl.enqueue_copy(queue, res, res_g, wait_for=[sum_evt], is_blocking=False)
+queue.finish()
+res = res[:n]
 
 print(res[:10])
@@ -1,4 +1,6 @@
-import json
+import sys
+
+import orjson
 
 data = {
     "topic": "qa4_lot_auction",
@@ -31,5 +33,7 @@ data = {
     }
 }
 
-json_string = json.dumps(data)
-print(json_string)
+# orjson gives bytes directly, write them as is instead of decoding to str
+# note: output is compact, no space after "," and ":" like json.dumps prints
+json_bytes = orjson.dumps(data)
+sys.stdout.buffer.write(json_bytes + b'\n')
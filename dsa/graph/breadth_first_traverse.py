@@ -1,17 +1,20 @@
-
+from collections import deque
 
 
 def breadth_first_traverse(graph, start):
     # breadth first traverse/search travels on each breadth/ neighbours first
     # It uses queue to achieve this , as queue provides FIFO
-    bft_queue = [start]
+    # deque gives O(1) popleft(), list.remove(first_item) shifts the whole list each time
+    bft_queue = deque([start])
+    visited = {start}  # so cyclic graphs don't enqueue same node again & again
 
     while len(bft_queue) > 0:
-        current_node = bft_queue[0]
-        bft_queue.remove(current_node)
+        current_node = bft_queue.popleft()
         print(current_node)
         for n in graph[current_node]:
-            bft_queue.append(n)
+            if n not in visited:
+                visited.add(n)
+                bft_queue.append(n)
 
 
 graph = {
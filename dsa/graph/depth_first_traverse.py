@@ -2,11 +2,14 @@ def depth_first_traverse(graph, start):
     # depth first traverse/ search first looks through each node's child node's till no further path exists
     # its is achieved by stach as it provides LIFO ; In python, we can use list and do appen() & pop() or remove(last_item)
     dft_stack = [start]
+    visited = {start}  # skip already seen nodes, else cycles keep pushing to stack forever
     while len(dft_stack) > 0:
         current_node = dft_stack.pop() # or could use .remove(last_item) #-1
         print(current_node)
         for n in graph[current_node]:
-            dft_stack.append(n)
+            if n not in visited:
+                visited.add(n)
+                dft_stack.append(n)
 
 
 
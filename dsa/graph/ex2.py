@@ -12,7 +12,9 @@ G.add_edges_from([
 
 # 3. Choose a layout (positioning of nodes)
 # spring_layout is the default but defining it explicitly allows for more control
-pos = nx.spring_layout(G)
+# fixed seed keeps the layout the same on every run; networkx switches to its
+# scipy sparse solver on its own once the graph gets big (500+ nodes)
+pos = nx.spring_layout(G, seed=0)
 
 # 4. Draw the graph components
 nx.draw(G, pos, with_labels=True, 
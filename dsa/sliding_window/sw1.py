@@ -2,12 +2,32 @@
 # Approach sliding window for O(n) runtime
 # AI code -> for learning
 
+def _lengthOfLongestSubstringAscii(buf: bytes) -> int:
+    # same sliding window, but for ascii input the last_seen hash is just a
+    # fixed table of 256 slots indexed by byte value -> no hashing per char
+    last_seen = [-1] * 256
+    left = 0
+    max_length = 0
+
+    for right, byte in enumerate(buf):
+        if last_seen[byte] >= left:
+            left = last_seen[byte] + 1
+
+        last_seen[byte] = right
+        if right - left + 1 > max_length:
+            max_length = right - left + 1
+
+    return max_length
+
 def lengthOfLongestSubstring(s: str) -> int:
+    print(s)
+    if s.isascii():
+        return _lengthOfLongestSubstringAscii(s.encode('ascii'))
+
     last_seen = {}
     left = 0
     max_length = 0
 
-    print(s)
     for right, char in enumerate(s):
         if char in last_seen and last_seen[char] >= left:
             left = last_seen[char] + 1
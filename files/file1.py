@@ -9,17 +9,17 @@ sample_rate = 44100  # Hz
 print("Recording audio for {} seconds...".format(duration))
 
 # Record audio
-audio = sd.rec(int(duration * sample_rate), samplerate=sample_rate, channels=1, dtype='float64')
+audio = sd.rec(int(duration * sample_rate), samplerate=sample_rate, channels=1, dtype='float32')
 sd.wait()  # Wait until recording is finished
 
 print("Recording complete!")
 
-# Flatten the array
-audio = audio.flatten()
+# Flatten the array (ravel gives a view, flatten always copies)
+audio = audio.ravel()
 
 # Plotting the waveform
 plt.figure(figsize=(12, 4))
-time = np.linspace(0, duration, len(audio))
+time = np.arange(len(audio), dtype=np.float32) * (1.0 / sample_rate)
 plt.plot(time, audio, color='royalblue')
 plt.title("Captured Audio Waveform")
 plt.xlabel("Time [s]")